@@ -1,10 +1,12 @@
 """Calibration module."""
 import numpy as np
 
-from typing import Dict 
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+import functools
 import os
-import json
+import re
+from dataclasses import dataclass
 from core.config import ROOTDIR
 from core.transform import (
     BaseToCCRadar,
@@ -14,7 +16,100 @@ from core.transform import (
     BaseToVicon,
 )
 
-
+# Fastest available JSON decoder, fed with the raw file bytes
+json_loads: Callable[[bytes], Any]
+# Streaming JSON parser, only preferred over the stdlib one with one of its
+# compiled backends
+ijson: Any = None
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        json_loads = ujson.loads
+    except ImportError:
+        import json
+        json_loads = json.loads
+        try:
+            import ijson as _ijson
+            if _ijson.backend in ("yajl2_c", "yajl2_cffi"):
+                ijson = _ijson
+        except ImportError:
+            pass
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Flag an array shared through the calibration cache as read-only."""
+    array.setflags(write=False)
+    return array
+
+
+def _read_config(filepath: str) -> str:
+    """Read a whole configuration file in a single call."""
+    with open(os.path.join(ROOTDIR, filepath), "r") as fh:
+        return fh.read()
+
+
+def _to_int(value: Union[str, bytes]) -> int:
+    """Convert a config value possibly written as a float to an integer."""
+    return int(float(value))
+
+
+def _to_bins(value: str) -> np.ndarray:
+    """Convert a whitespace-separated list of bins to an array."""
+    return _read_only(np.fromstring(value, dtype=np.float64, sep=" "))
+
+
+def _iter_fields(content: str,
+                 sep: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+    """Yield the (name, value) pairs of a line-oriented config.
+
+    Comment and blank lines are skipped and names are lower-cased.
+
+    Arguments:
+        content: Content of the configuration file
+        sep: Separator between a field name and its value. Any whitespace
+            if None
+    """
+    for line in content.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        name, value = line.split(sep, 1)
+        yield name.lower(), value
+
+
+# Antenna configuration scalar fields and their parsers
+_ANTENNA_FIELDS: Dict[str, Callable[[str], Any]] = {
+    "num_rx": _to_int,
+    "num_tx": _to_int,
+    "f_design": float,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _load_antenna(filepath: str) -> Dict[str, Any]:
+    """Load and cache an antenna configuration file."""
+    config: Dict[str, Any] = {}
+    # Flattened RX and TX layout rows, keyed by the line tag
+    layout: Dict[str, List[int]] = {"rx": [], "tx": []}
+    for name, value in _iter_fields(_read_config(filepath)):
+        rows: Optional[List[int]] = layout.get(name)
+        if rows is not None:
+            rows.extend(int(x) for x in value.split())
+        elif name in _ANTENNA_FIELDS:
+            config[name] = _ANTENNA_FIELDS[name](value)
+    config["rxl"] = _read_only(_load_layout(layout["rx"]))
+    config["txl"] = _read_only(_load_layout(layout["tx"]))
+    return config
+
+
+def _load_layout(values: List[int]) -> np.ndarray:
+    """Build a [idx, az, el] array from flattened antenna layout rows."""
+    return np.fromiter(values, dtype=np.int32, count=len(values)).reshape(-1, 3)
+
+
+@dataclass(init=False, eq=False)
 class AntennaConfig:
     """Antenna configuration.
 
@@ -39,32 +134,69 @@ class AntennaConfig:
         matrices is [dev4, dev1, dev3, dev2] for the cascade radar.
     """
 
+    __slots__ = (
+        "num_rx",
+        "num_tx",
+        "f_design",
+        "rxl",
+        "txl",
+    )
+
+    num_rx: int
+    num_tx: int
+    f_design: float
+    rxl: np.ndarray
+    txl: np.ndarray
+
     def __init__(self, filepath: str) -> None:
         """Init Antenna config.
 
         Argument:
             filepath: Path to the antenna configuration file
         """
-        rxl = []    # RX layout
-        txl = []    # TX layout
-        with open(os.path.join(ROOTDIR, filepath), "r") as fh:
-            for line in fh:
-                if line.startswith("# "):
-                    continue
-                else:
-                    chunks = line.strip().split(" ")
-                    if chunks[0] == "rx":
-                        rxl.append([int(x) for x in chunks[1:]])
-                    elif chunks[0] == "tx":
-                        txl.append([int(x) for x in chunks[1:]])
-                    else:
-                        setattr(self, chunks[0].lower(), float(chunks[1]))
-        self.num_rx = int(self.num_rx)
-        self.num_tx = int(self.num_tx)
-        self.rxl = np.array(rxl)
-        self.txl = np.array(txl)
-
-
+        config = _load_antenna(filepath)
+        self.num_rx = config["num_rx"]
+        self.num_tx = config["num_tx"]
+        self.f_design = config["f_design"]
+        self.rxl = config["rxl"]
+        self.txl = config["txl"]
+
+
+# Coupling calibration header fields and their parsers
+_COUPLING_FIELDS: Dict[str, Callable[[str], Any]] = {
+    "num_tx": int,
+    "num_rx": int,
+    "num_range_bins": int,
+    "num_doppler_bins": int,
+}
+
+
+# Start of the coupling data line, never part of a comment line
+_COUPLING_DATA_RE = re.compile(r"^data:", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_coupling(filepath: str) -> Dict[str, Any]:
+    """Load and cache a coupling calibration file."""
+    config: Dict[str, Any] = {}
+    content = _read_config(filepath)
+    # The bulky comma-separated data line is handed over to NumPy as is
+    m = _COUPLING_DATA_RE.search(content)
+    if m is None:
+        raise ValueError(f"Missing coupling 'data:' line in {filepath}")
+    end = content.find("\n", m.end())
+    if end < 0:
+        end = len(content)
+    header = content[:m.start()] + content[end:]
+    data = content[m.end():end]
+    for name, value in _iter_fields(header, ":"):
+        if name in _COUPLING_FIELDS:
+            config[name] = _COUPLING_FIELDS[name](value)
+    config["data"] = _read_only(np.fromstring(data, dtype=np.float64, sep=","))
+    return config
+
+
+@dataclass(init=False, eq=False)
 class CouplingCalibration:
     """Coupling calibration.
 
@@ -73,26 +205,57 @@ class CouplingCalibration:
         num_tx (int): Number of transmission antenna
         num_range_bins (int): Number of range bins
         num_doppler_bins (int): Number of doppler frequency bins
-        data (list[float]): Array description coupling calibartion data
+        data (NDArray): Array description coupling calibartion data
 
     TODO: Process rge raw calibration data
     """
 
-    def __init__(self, filepath: str) -> None:
-        """Init coupling calibration."""
-        with open(os.path.join(ROOTDIR, filepath), "r") as fh:
-            for line in fh:
-                if line.startswith("# "):
-                    continue
-                else:
-                    name, value = line.split(":")
-                    value = value.split(",")
-                    if len(value) > 1:
-                        setattr(self, name.lower(), [float(x) for x in value])
-                    else:
-                        setattr(self, name.lower(), int(value[0]))
+    __slots__ = (
+        "num_rx",
+        "num_tx",
+        "num_range_bins",
+        "num_doppler_bins",
+        "data",
+    )
 
+    num_rx: int
+    num_tx: int
+    num_range_bins: int
+    num_doppler_bins: int
+    data: np.ndarray
 
+    def __init__(self, filepath: str) -> None:
+        """Init coupling calibration."""
+        config = _load_coupling(filepath)
+        self.num_rx = config["num_rx"]
+        self.num_tx = config["num_tx"]
+        self.num_range_bins = config["num_range_bins"]
+        self.num_doppler_bins = config["num_doppler_bins"]
+        self.data = config["data"]
+
+
+# Heatmap configuration fields and their parsers
+_HEATMAP_FIELDS: Dict[str, Callable[[str], Any]] = {
+    "num_range_bins": _to_int,
+    "num_elevation_bins": _to_int,
+    "num_azimuth_bins": _to_int,
+    "range_bin_width": float,
+    "azimuth_bins": _to_bins,
+    "elevation_bins": _to_bins,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _load_heatmap(filepath: str) -> Dict[str, Any]:
+    """Load and cache a heatmap configuration file."""
+    config: Dict[str, Any] = {}
+    for name, value in _iter_fields(_read_config(filepath)):
+        if name in _HEATMAP_FIELDS:
+            config[name] = _HEATMAP_FIELDS[name](value)
+    return config
+
+
+@dataclass(init=False, eq=False)
 class HeatmapConfiguration:
     """Heatmap configuration.
 
@@ -101,27 +264,71 @@ class HeatmapConfiguration:
         num_elevation_bins (int): Number of elevation bins
         num_azimuth_bins (int): Number of azimuth bins
         range_bin_width (float): Width of range bin - range resolution
-        azimuth_bins (list[float]): Array describing the azimuth bin
-        elevation_bins (list[float]): Array describing the elevation bin
+        azimuth_bins (NDArray): Array describing the azimuth bin
+        elevation_bins (NDArray): Array describing the elevation bin
     """
 
+    __slots__ = (
+        "num_range_bins",
+        "num_elevation_bins",
+        "num_azimuth_bins",
+        "range_bin_width",
+        "azimuth_bins",
+        "elevation_bins",
+    )
+
+    num_range_bins: int
+    num_elevation_bins: int
+    num_azimuth_bins: int
+    range_bin_width: float
+    azimuth_bins: np.ndarray
+    elevation_bins: np.ndarray
+
     def __init__(self, filepath: str) -> None:
         """Init heatmap configuration."""
-        with open(os.path.join(ROOTDIR, filepath), "r") as fh:
-            for line in fh:
-                if line.startswith("# "):
-                    continue
-                else:
-                    value: list[str] = line.split(" ")
-                    if len(value) > 2:
-                        setattr(self, value[0].lower(), [float(x) for x in value[1:-1]])
-                    else:
-                        setattr(self, value[0].lower(), float(value[1]))
-        self.num_range_bins = int(self.num_range_bins)
-        self.num_elevation_bins = int(self.num_elevation_bins)
-        self.num_azimuth_bins = int(self.num_azimuth_bins)
-
+        config = _load_heatmap(filepath)
+        self.num_range_bins = config["num_range_bins"]
+        self.num_elevation_bins = config["num_elevation_bins"]
+        self.num_azimuth_bins = config["num_azimuth_bins"]
+        self.range_bin_width = config["range_bin_width"]
+        self.azimuth_bins = config["azimuth_bins"]
+        self.elevation_bins = config["elevation_bins"]
+
+
+# "<name> <number>" waveform fields; comment lines never match
+_WAVEFORM_RE = re.compile(
+    rb"^([a-zA-Z_]+)[ \t]+([\d.eE+-]+)[ \t\r]*$", re.MULTILINE
+)
 
+# Waveform configuration fields and their parsers
+_WAVEFORM_FIELDS: Dict[str, Callable[[bytes], Any]] = {
+    "num_rx": _to_int,
+    "num_tx": _to_int,
+    "num_adc_samples_per_chirp": _to_int,
+    "num_chirps_per_frame": _to_int,
+    "adc_sample_frequency": float,
+    "start_frequency": float,
+    "idle_time": float,
+    "adc_start_time": float,
+    "ramp_end_time": float,
+    "frequency_slope": float,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _load_waveform(filepath: str) -> Dict[str, Any]:
+    """Load and cache a waveform configuration file."""
+    with open(os.path.join(ROOTDIR, filepath), "rb") as fh:
+        content: bytes = fh.read()
+    config: Dict[str, Any] = {}
+    for m in _WAVEFORM_RE.finditer(content):
+        name: str = m.group(1).decode().lower()
+        if name in _WAVEFORM_FIELDS:
+            config[name] = _WAVEFORM_FIELDS[name](m.group(2))
+    return config
+
+
+@dataclass(init=False, eq=False)
 class WaveformConfiguration:
     """Waveform configuration.
 
@@ -138,21 +345,70 @@ class WaveformConfiguration:
         frequency_slope (float): Frequency slope
     """
 
+    __slots__ = (
+        "num_rx",
+        "num_tx",
+        "num_adc_samples_per_chirp",
+        "num_chirps_per_frame",
+        "adc_sample_frequency",
+        "start_frequency",
+        "idle_time",
+        "adc_start_time",
+        "ramp_end_time",
+        "frequency_slope",
+    )
+
+    num_rx: int
+    num_tx: int
+    num_adc_samples_per_chirp: int
+    num_chirps_per_frame: int
+    adc_sample_frequency: float
+    start_frequency: float
+    idle_time: float
+    adc_start_time: float
+    ramp_end_time: float
+    frequency_slope: float
+
     def __init__(self, filepath: str) -> None:
         """Init waveform configuration."""
-        with open(os.path.join(ROOTDIR, filepath), "r") as fh:
-            for line in fh:
-                if line.startswith("# "):
-                    continue
-                else:
-                    name, value = line.split(" ")
-                    setattr(self, name.lower(), float(value))
-        self.num_rx = int(self.num_rx)
-        self.num_tx = int(self.num_tx)
-        self.num_adc_samples_per_chirp = int(self.num_adc_samples_per_chirp)
-        self.num_chirps_per_frame = int(self.num_chirps_per_frame)
-
-
+        config = _load_waveform(filepath)
+        self.num_rx = config["num_rx"]
+        self.num_tx = config["num_tx"]
+        self.num_adc_samples_per_chirp = config["num_adc_samples_per_chirp"]
+        self.num_chirps_per_frame = config["num_chirps_per_frame"]
+        self.adc_sample_frequency = config["adc_sample_frequency"]
+        self.start_frequency = config["start_frequency"]
+        self.idle_time = config["idle_time"]
+        self.adc_start_time = config["adc_start_time"]
+        self.ramp_end_time = config["ramp_end_time"]
+        self.frequency_slope = config["frequency_slope"]
+
+
+@functools.lru_cache(maxsize=32)
+def _load_phase(filepath: str) -> Dict[str, Any]:
+    """Load and cache a phase/frequency calibration file."""
+    config: Dict[str, Any]
+    with open(os.path.join(ROOTDIR, filepath), "rb") as fh:
+        if ijson is not None:
+            # Only materialize the 'antennaCalib' subtree
+            config = dict(ijson.kvitems(fh, "antennaCalib", use_float=True))
+        else:
+            config = json_loads(fh.read())["antennaCalib"]
+    return {
+        "num_rx": config["numRx"],
+        "num_tx": config["numTx"],
+        "frequency_slope": config["frequencySlope"],
+        "sampling_rate": config["samplingRate"],
+        "frequency_calibration_matrix": _read_only(np.asarray(
+            config["frequencyCalibrationMatrix"], dtype=np.float64
+        )),
+        "phase_calibration_matrix": _read_only(np.asarray(
+            config["phaseCalibrationMatrix"], dtype=np.float64
+        )),
+    }
+
+
+@dataclass(init=False, eq=False)
 class PhaseCalibration:
     """Phase/Frequency calibration.
 
@@ -161,32 +417,39 @@ class PhaseCalibration:
         num_tx (int): Number of transmission antenna
         frequency_slope (float): Frequency slope
         sampling_rate (float): ADC sampling frequency in Herz
-        frequency_calibration_matrix (list[float]): Sensor frequency
+        frequency_calibration_matrix (NDArray): Sensor frequency
         calibration matrix
+        phase_calibration_matrix (NDArray): Sensor phase calibration
+        matrix as interleaved real and imaginary parts
     """
 
+    __slots__ = (
+        "num_rx",
+        "num_tx",
+        "frequency_slope",
+        "sampling_rate",
+        "frequency_calibration_matrix",
+        "phase_calibration_matrix",
+    )
+
+    num_rx: int
+    num_tx: int
+    frequency_slope: float
+    sampling_rate: float
+    frequency_calibration_matrix: np.ndarray
+    phase_calibration_matrix: np.ndarray
+
     def __init__(self, filepath: str) -> None:
         """Init Phase/Frequency configuration."""
-        with open(os.path.join(ROOTDIR, filepath), "r") as fh:
-            config = json.load(fh)
-            setattr(self, "num_rx", config["antennaCalib"]["numRx"])
-            setattr(self, "num_tx", config["antennaCalib"]["numTx"])
-            setattr(self,
-                "frequency_slope",
-                config["antennaCalib"]["frequencySlope"]
-            )
-            setattr(self,
-                "sampling_rate",
-                config["antennaCalib"]["samplingRate"]
-            )
-            setattr(self,
-                "frequency_calibration_matrix",
-                config["antennaCalib"]["frequencyCalibrationMatrix"]
-            )
-            setattr(self,
-                "phase_calibration_matrix",
-                config["antennaCalib"]["phaseCalibrationMatrix"]
-            )
+        config = _load_phase(filepath)
+        self.num_rx = config["num_rx"]
+        self.num_tx = config["num_tx"]
+        self.frequency_slope = config["frequency_slope"]
+        self.sampling_rate = config["sampling_rate"]
+        self.frequency_calibration_matrix = config[
+            "frequency_calibration_matrix"
+        ]
+        self.phase_calibration_matrix = config["phase_calibration_matrix"]
 
 
 class SCRadarCalibration:
@@ -201,6 +464,8 @@ class SCRadarCalibration:
         waveform: Waveform generation parameters and calibration
         d: The optimal inter-antenna distance estimation in unit of
            a wavelength
+        coupling_calibration: Coupling calibration array to apply on the
+           range fft
     """
 
     def __init__(self, config: Dict[str, str]=[]) -> None:
@@ -235,15 +500,18 @@ class SCRadarCalibration:
         fdesign: float = self.antenna.f_design
         self.d = 0.5 * ((fstart + (fslope * stime) / 2) / fdesign)
 
-    def get_coupling_calibration(self) -> np.array:
-        """Return the coupling calibration array to apply on the range fft."""
-        return np.array(self.coupling.data).reshape(
+        # Read-only view of the coupling data in its broadcast shape
+        self.coupling_calibration = self.coupling.data.reshape(
             self.coupling.num_tx,
             self.coupling.num_rx,
             1,
             self.waveform.num_adc_samples_per_chirp,
         )
 
+    def get_coupling_calibration(self) -> np.ndarray:
+        """Return the coupling calibration array to apply on the range fft."""
+        return self.coupling_calibration
+
 # Reference： file/signalPrcesssing_userguide_4chipCascade.pdf
 class CCRadarCalibration(SCRadarCalibration):
     """Cascade Chip Radar Calibration.
@@ -273,51 +541,76 @@ class CCRadarCalibration(SCRadarCalibration):
         self.phase = PhaseCalibration(config["phase"])
 
     # 4.2 Apply calibration matrix in MIMO operation ——> Second Step: phase and amplitude calibration
-    def get_phase_calibration(self) -> np.array:
-        """Return the phase calibration array."""
+    @functools.cached_property
+    def phase_calibration(self) -> np.ndarray:
+        """Phase calibration array.
+
+        NOTE: Held in complex64, the precision of the raw ADC samples
+        it is applied to.
+        """
         # Phase calibrationm atrix
-        pm = np.array(self.phase.phase_calibration_matrix)
-        pm = pm[::2] + 1j * pm[1::2]
-        pm = pm[0] / pm
-        return pm.reshape(
+        # Interleaved real/imaginary parts reinterpreted as complex values
+        pm: np.ndarray = self.phase.phase_calibration_matrix.view(np.complex128)
+        pm = (pm[0] / pm).astype(np.complex64)
+        return _read_only(pm.reshape(
             self.phase.num_tx,
             self.phase.num_rx,
             1,
             1
-        )
+        ))
+
+    def get_phase_calibration(self) -> np.ndarray:
+        """Return the phase calibration array."""
+        return self.phase_calibration
 
     # 4.2 Apply calibration matrix in MIMO operation ——> First step: frequency calibration
-    def get_frequency_calibration(self) -> np.array:
-        """Return the frequency calibration array."""
+    @functools.cached_property
+    def frequency_calibration(self) -> np.ndarray:
+        """Frequency calibration array.
+
+        NOTE: The phase ramp is evaluated in float32 and the array is held
+        in complex64, the precision of the raw ADC samples it is applied
+        to.
+        """
         num_tx: int = self.phase.num_tx
         num_rx: int = self.phase.num_rx
 
         # Calibration frequency slope
         fcal_slope: float = self.phase.frequency_slope
         # Calibration sampling rate
-        cal_srate: int = self.phase.sampling_rate
+        cal_srate: float = self.phase.sampling_rate
 
-        fcal_matrix = np.array(self.phase.frequency_calibration_matrix)
+        fcal_matrix = self.phase.frequency_calibration_matrix
 
         fslope: float = self.waveform.frequency_slope
-        srate: int = self.waveform.adc_sample_frequency
+        srate: float = self.waveform.adc_sample_frequency
+        # Number of ADC samples per chirp
+        ns: int = self.waveform.num_adc_samples_per_chirp
+
+        # Scalar part of the phase correction folded into a single factor
+        k: float = 2 * np.pi * (fslope / fcal_slope) * (cal_srate / srate) / ns
 
         # Delta P
         # 
-        dp = fcal_matrix - fcal_matrix[0]
+        dp = ((fcal_matrix[0] - fcal_matrix) * k).reshape(num_tx, num_rx)
 
-        cal_matrix = 2 * np.pi * dp * (fslope / fcal_slope) * (cal_srate / srate)
-        cal_matrix /= self.waveform.num_adc_samples_per_chirp
-        cal_matrix.reshape(num_tx, num_rx)
-        cal_matrix = np.expand_dims(cal_matrix, -1) * np.arange(
-            self.waveform.num_adc_samples_per_chirp
+        # The negated phase ramp is written straight into the imaginary
+        # part of the output buffer, then exponentiated in place
+        cal_matrix: np.ndarray = np.empty(
+            (num_tx, num_rx, 1, ns), dtype=np.complex64
         )
-        return np.exp(-1j * cal_matrix).reshape(
-            num_tx,
-            num_rx,
-            1,
-            self.waveform.num_adc_samples_per_chirp
+        cal_matrix.real = 0
+        np.multiply.outer(
+            dp.astype(np.float32),
+            np.arange(ns, dtype=np.float32),
+            out=cal_matrix.imag[:, :, 0, :],
         )
+        np.exp(cal_matrix, out=cal_matrix)
+        return _read_only(cal_matrix)
+
+    def get_frequency_calibration(self) -> np.ndarray:
+        """Return the frequency calibration array."""
+        return self.frequency_calibration
 
 
 class BaseTransform: